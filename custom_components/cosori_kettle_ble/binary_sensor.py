@@ -71,6 +71,7 @@ class CosoriKettleBinarySensor(CoordinatorEntity[CosoriKettleCoordinator], Binar
     @property
     def is_on(self) -> bool:
         """Return the state of the binary sensor."""
-        if self.coordinator.data and self.entity_description.value_fn:
-            return self.entity_description.value_fn(self.coordinator.data)
+        data = self.coordinator.data
+        if data and (value_fn := self.entity_description.value_fn):
+            return value_fn(data)
         return False
@@ -13,7 +13,7 @@ from homeassistant.components.climate import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -40,22 +40,28 @@ PRESET_OOLONG = "Oolong"
 PRESET_COFFEE = "Coffee"
 PRESET_MY_TEMP = "MyBrew"
 
-PRESET_TO_KETTLE_MODE = {
-    PRESET_BOIL: MODE_BOIL,
-    PRESET_GREEN_TEA: MODE_GREEN_TEA,
-    PRESET_OOLONG: MODE_OOLONG,
-    PRESET_COFFEE: MODE_COFFEE,
-    PRESET_MY_TEMP: MODE_MY_TEMP,
-}
+# Preset name, kettle mode and its fixed temperature (in Fahrenheit);
+# MyBrew heats to the kettle's own my_temp setting
+PRESETS: tuple[tuple[str, int, int | None], ...] = (
+    (PRESET_BOIL, MODE_BOIL, 212),
+    (PRESET_GREEN_TEA, MODE_GREEN_TEA, 180),
+    (PRESET_OOLONG, MODE_OOLONG, 195),
+    (PRESET_COFFEE, MODE_COFFEE, 205),
+    (PRESET_MY_TEMP, MODE_MY_TEMP, None),
+)
+
+PRESET_TO_KETTLE_MODE = {preset: mode for preset, mode, _ in PRESETS}
 
-KETTLE_MODE_TO_PRESET = {v: k for k, v in PRESET_TO_KETTLE_MODE.items()}
+KETTLE_MODE_TO_PRESET = {mode: preset for preset, mode, _ in PRESETS}
 
 # Temperature for each mode (in Fahrenheit)
-MODE_TEMPS = {
-    MODE_BOIL: 212,
-    MODE_GREEN_TEA: 180,
-    MODE_OOLONG: 195,
-    MODE_COFFEE: 205,
+MODE_TEMPS = {mode: temp_f for _, mode, temp_f in PRESETS if temp_f is not None}
+
+# Temperatures within 2 deg F (approximately 1 deg C) of a preset snap to it
+TEMP_F_TO_MODE = {
+    temp_f: (kettle_mode, preset_temp)
+    for kettle_mode, preset_temp in MODE_TEMPS.items()
+    for temp_f in range(preset_temp - 2, preset_temp + 3)
 }
 
 
@@ -76,13 +82,7 @@ class CosoriKettleClimate(CoordinatorEntity[CosoriKettleCoordinator], ClimateEnt
     _attr_name = None
     _attr_temperature_unit = UnitOfTemperature.FAHRENHEIT
     _attr_hvac_modes = [HVACMode.OFF, HVACMode.HEAT]
-    _attr_preset_modes = [
-        PRESET_BOIL,
-        PRESET_GREEN_TEA,
-        PRESET_OOLONG,
-        PRESET_COFFEE,
-        PRESET_MY_TEMP,
-    ]
+    _attr_preset_modes = [preset for preset, _, _ in PRESETS]
     _attr_supported_features = (
         ClimateEntityFeature.TARGET_TEMPERATURE
         | ClimateEntityFeature.PRESET_MODE
@@ -108,25 +108,26 @@ class CosoriKettleClimate(CoordinatorEntity[CosoriKettleCoordinator], ClimateEnt
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("temperature")
+        if data := self.coordinator.data:
+            return data.get("temperature")
         return None
 
     @property
     def target_temperature(self) -> float | None:
         """Return the target temperature."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("setpoint")
+        if data := self.coordinator.data:
+            return data.get("setpoint")
         return None
 
     @property
     def hvac_mode(self) -> HVACMode:
         """Return current HVAC mode."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return HVACMode.OFF
 
         # If not heating, return OFF
-        if not self.coordinator.data.get("heating"):
+        if not data.get("heating"):
             return HVACMode.OFF
 
         # If heating, return HEAT
@@ -135,20 +136,21 @@ class CosoriKettleClimate(CoordinatorEntity[CosoriKettleCoordinator], ClimateEnt
     @property
     def preset_mode(self) -> str | None:
         """Return current preset mode."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
 
         # Map the kettle mode to preset
-        kettle_mode = self.coordinator.data.get("mode")
+        kettle_mode = data.get("mode")
         return KETTLE_MODE_TO_PRESET.get(kettle_mode, PRESET_MY_TEMP)
 
     @property
     def hvac_action(self) -> HVACAction:
         """Return current HVAC action."""
-        if self.coordinator.data:
-            if self.coordinator.data.get("heating"):
+        if data := self.coordinator.data:
+            if data.get("heating"):
                 return HVACAction.HEATING
-            if self.coordinator.data.get("stage") == 0:
+            if data.get("stage") == 0:
                 return HVACAction.IDLE
         return HVACAction.OFF
 
@@ -163,28 +165,28 @@ class CosoriKettleClimate(CoordinatorEntity[CosoriKettleCoordinator], ClimateEnt
 
         temp_f = int(temperature)
 
-        # Find the closest mode temperature within 2 degrees F (approximately 1 degree C)
-        mode = MODE_MY_TEMP
-        for kettle_mode, preset_temp in MODE_TEMPS.items():
-            if abs(temp_f - preset_temp) <= 2:
-                mode = kettle_mode
-                temp_f = preset_temp  # Use the exact preset temperature
-                break
+        # Use the preset mode and its exact temperature if close to one
+        mode, temp_f = TEMP_F_TO_MODE.get(temp_f, (MODE_MY_TEMP, temp_f))
 
         await self.coordinator.async_set_mode(mode, temp_f, 0)
-        await self.coordinator.async_request_refresh()
+        self._async_update_data_optimistically(
+            mode=mode,
+            setpoint=temp_f,
+            configured_hold_time=0,
+            remaining_hold_time=0,
+            heating=True,
+        )
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set HVAC mode."""
         if hvac_mode == HVACMode.OFF:
             await self.coordinator.async_stop_heating()
+            self._async_update_data_optimistically(stage=0, heating=False)
         elif hvac_mode == HVACMode.HEAT:
             # Start heating using the current preset mode or My Temp as default
             preset = self.preset_mode or PRESET_MY_TEMP
             await self.async_set_preset_mode(preset)
 
-        await self.coordinator.async_request_refresh()
-
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set preset mode."""
         if preset_mode not in PRESET_TO_KETTLE_MODE:
@@ -198,10 +200,28 @@ class CosoriKettleClimate(CoordinatorEntity[CosoriKettleCoordinator], ClimateEnt
             temp_f = MODE_TEMPS[kettle_mode]
         else:
             # MY_TEMP mode - use current my_temp or default
-            temp_f = self.coordinator.data.get("my_temp", 212) if self.coordinator.data else 212
+            data = self.coordinator.data
+            temp_f = data.get("my_temp", 212) if data else 212
 
         await self.coordinator.async_set_mode(kettle_mode, temp_f, 0)
-        await self.coordinator.async_request_refresh()
+        self._async_update_data_optimistically(
+            mode=kettle_mode,
+            setpoint=temp_f,
+            configured_hold_time=0,
+            remaining_hold_time=0,
+            heating=True,
+        )
+
+    @callback
+    def _async_update_data_optimistically(self, **changes: Any) -> None:
+        """Apply the expected result of an acknowledged command.
+
+        Saves polling the kettle after every command; the compact status it
+        sends on its own corrects anything that turned out differently.
+        The heating stage is left for the kettle to report, since it depends
+        on the mode.
+        """
+        self.coordinator.async_set_updated_data({**(self.coordinator.data or {}), **changes})
 
     async def async_turn_on(self) -> None:
         """Turn on."""
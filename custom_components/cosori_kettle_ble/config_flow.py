@@ -1,6 +1,7 @@
 """Config flow for Cosori Kettle BLE integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 import secrets
 from typing import Any
@@ -13,7 +14,13 @@ from homeassistant.components.bluetooth import BluetoothServiceInfoBleak
 from homeassistant.const import CONF_ADDRESS
 from homeassistant.data_entry_flow import FlowResult
 
-from .const import CONF_DEVICE_ID, CONF_REGISTRATION_KEY, DOMAIN, SERVICE_UUID
+from .const import (
+    CONF_DEVICE_ID,
+    CONF_REGISTRATION_KEY,
+    DOMAIN,
+    PAIRING_TIMEOUT,
+    SERVICE_UUID,
+)
 from .cosori_kettle.exceptions import (
     DeviceNotInPairingModeError,
     InvalidRegistrationKeyError,
@@ -23,6 +30,40 @@ from .cosori_kettle.protocol import parse_registration_key_from_packets
 
 _LOGGER = logging.getLogger(__name__)
 
+_SERVICE_UUID_LOWER = SERVICE_UUID.lower()
+
+# Static form schemas, built once at import
+STEP_PAIRING_MODE_SCHEMA = vol.Schema(
+    {
+        vol.Required("pairing_mode"): vol.In(
+            {
+                "new": "Pair a new device (device must be in pairing mode)",
+                "existing": "I have an existing registration key",
+                "capture": "Extract key from captured Bluetooth packets",
+            }
+        ),
+    }
+)
+
+STEP_ENTER_KEY_SCHEMA = vol.Schema(
+    {
+        vol.Required("registration_key"): str,
+    }
+)
+
+STEP_CAPTURE_PACKETS_SCHEMA = vol.Schema(
+    {
+        vol.Required("packet1"): str,
+        vol.Required("packet2"): str,
+        vol.Required("packet3"): str,
+    }
+)
+
+
+def _has_service_uuid(info: BluetoothServiceInfoBleak) -> bool:
+    """Return whether the advertisement lists the kettle service UUID."""
+    return any(uuid.lower() == _SERVICE_UUID_LOWER for uuid in info.service_uuids)
+
 
 class CosoriKettleConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Cosori Kettle BLE."""
@@ -46,9 +87,7 @@ class CosoriKettleConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._discovery_info = discovery_info
 
         # Check if device has our service
-        if SERVICE_UUID.lower() not in [
-            str(uuid).lower() for uuid in discovery_info.service_uuids
-        ]:
+        if not _has_service_uuid(discovery_info):
             return self.async_abort(reason="not_supported")
 
         return await self.async_step_confirm()
@@ -90,17 +129,7 @@ class CosoriKettleConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="pairing_mode",
-            data_schema=vol.Schema(
-                {
-                    vol.Required("pairing_mode"): vol.In(
-                        {
-                            "new": "Pair a new device (device must be in pairing mode)",
-                            "existing": "I have an existing registration key",
-                            "capture": "Extract key from captured Bluetooth packets",
-                        }
-                    ),
-                }
-            ),
+            data_schema=STEP_PAIRING_MODE_SCHEMA,
             description_placeholders={
                 "name": (
                     self._discovery_info.name or "Cosori Kettle"
@@ -130,10 +159,15 @@ class CosoriKettleConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             if ble_device is None:
                 return self.async_abort(reason="device_not_found")
 
+            # Bound the connect as well as register + hello
+            pairing_timeout = asyncio.timeout(PAIRING_TIMEOUT)
+
             # Attempt pairing
             try:
-                async with CosoriKettle(ble_device, registration_key) as kettle:
-                    await kettle.pair()  # Sends register + hello
+                async with pairing_timeout:
+                    async with CosoriKettle(ble_device, registration_key) as kettle:
+                        # Sends register + hello
+                        await kettle.pair()
 
                 # Success! Create config entry
                 return self.async_create_entry(
@@ -149,6 +183,14 @@ class CosoriKettleConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
             except DeviceNotInPairingModeError:
                 errors["base"] = "device_not_in_pairing_mode"
+            except asyncio.TimeoutError as err:
+                if not pairing_timeout.expired():
+                    # An ACK timed out inside pair(), not the pairing as a whole
+                    _LOGGER.exception("Failed to pair device: %s", err)
+                    errors["base"] = "pairing_failed"
+                else:
+                    _LOGGER.debug("Timed out pairing with %s", self._selected_address)
+                    errors["base"] = "pairing_timeout"
             except Exception as err:
                 _LOGGER.exception("Failed to pair device: %s", err)
                 errors["base"] = "pairing_failed"
@@ -176,14 +218,18 @@ class CosoriKettleConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
             registration_key_hex = user_input["registration_key"].strip().replace(" ", "")
 
-            # Validate format
-            if len(registration_key_hex) != 32:
-                errors["registration_key"] = "invalid_key_length"
+            # Validate format; the length only decides which error to show
+            try:
+                registration_key = bytes.fromhex(registration_key_hex)
+            except ValueError:
+                errors["registration_key"] = (
+                    "invalid_key_length"
+                    if len(registration_key_hex) != 32
+                    else "invalid_key_format"
+                )
             else:
-                try:
-                    registration_key = bytes.fromhex(registration_key_hex)
-                except ValueError:
-                    errors["registration_key"] = "invalid_key_format"
+                if len(registration_key) != 16:
+                    errors["registration_key"] = "invalid_key_length"
                 else:
                     # Get BLE device
                     ble_device = bluetooth.async_ble_device_from_address(
@@ -207,7 +253,7 @@ class CosoriKettleConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                             data={
                                 CONF_DEVICE_ID: self._selected_address,
                                 CONF_ADDRESS: self._selected_address,
-                                CONF_REGISTRATION_KEY: registration_key_hex,
+                                CONF_REGISTRATION_KEY: registration_key.hex(),
                             },
                         )
 
@@ -219,11 +265,7 @@ class CosoriKettleConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="enter_key",
-            data_schema=vol.Schema(
-                {
-                    vol.Required("registration_key"): str,
-                }
-            ),
+            data_schema=STEP_ENTER_KEY_SCHEMA,
             errors=errors,
             description_placeholders={
                 "name": (
@@ -298,13 +340,7 @@ class CosoriKettleConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="capture_packets",
-            data_schema=vol.Schema(
-                {
-                    vol.Required("packet1"): str,
-                    vol.Required("packet2"): str,
-                    vol.Required("packet3"): str,
-                }
-            ),
+            data_schema=STEP_CAPTURE_PACKETS_SCHEMA,
             errors=errors,
             description_placeholders={
                 "name": (
@@ -338,7 +374,7 @@ class CosoriKettleConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         for info in discovered:
             if info.address in current_addresses:
                 continue
-            if info.name == "Cosori Gooseneck Kettle" or SERVICE_UUID.lower() in [str(uuid).lower() for uuid in info.service_uuids]:
+            if info.name == "Cosori Gooseneck Kettle" or _has_service_uuid(info):
                 self._discovered_devices[info.address] = info
 
         if not self._discovered_devices:
@@ -76,3 +76,4 @@ CONF_REGISTRATION_KEY: Final = "registration_key"
 UPDATE_INTERVAL: Final = 15  # seconds
 ACK_TIMEOUT_RETRY_DELAY: Final = 5  # seconds before retrying after ACK timeout
 MAX_RECONNECT_ATTEMPTS: Final = 3  # max attempts to reconnect on disconnect
+PAIRING_TIMEOUT: Final = 30  # seconds allowed for register + hello during pairing
@@ -72,6 +72,9 @@ class CosoriKettleCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._registration_key = registration_key
         self._lock = asyncio.Lock()
 
+        # Background status requests, kept so they can be cancelled on disconnect
+        self._background_tasks: set[asyncio.Task] = set()
+
         # Device information
         self._hw_version: str | None = None
         self._sw_version: str | None = None
@@ -164,7 +167,9 @@ class CosoriKettleCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 disconnected_callback=self._on_disconnect,
             )
 
-            # Read device info BEFORE connecting (uses temporary client internally)
+            # Connect once and read device info over the same connection
+            await self._client.connect()
+
             device_info = await self._client.read_device_info()
             self._hw_version = device_info.hardware_version
             self._sw_version = device_info.software_version
@@ -172,12 +177,9 @@ class CosoriKettleCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             self._manufacturer = device_info.manufacturer
             self._protocol_version = device_info.protocol_version
 
-            # Update protocol version on client if detected
+            # Update protocol version on client before any command is built
             self._client.set_protocol_version(device_info.protocol_version)
 
-            # Now connect for actual communication
-            await self._client.connect()
-
             # Send hello
             await self._send_hello()
 
@@ -209,6 +211,12 @@ class CosoriKettleCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     async def _disconnect(self) -> None:
         """Disconnect from the device."""
+        if self._background_tasks:
+            tasks = list(self._background_tasks)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
         if self._client:
             try:
                 await self._client.disconnect()
@@ -226,12 +234,13 @@ class CosoriKettleCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         Args:
             frame: Received frame from device
         """
-        _LOGGER.debug(
-            "Received frame: type=%02x seq=%02x payload=%s",
-            frame.frame_type,
-            frame.seq,
-            frame.payload.hex(),
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Received frame: type=%02x seq=%02x payload=%s",
+                frame.frame_type,
+                frame.seq,
+                frame.payload.hex(),
+            )
 
         if len(frame.payload) < 2:
             return
@@ -325,7 +334,9 @@ class CosoriKettleCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # If state changed (not just temperature), request full status immediately
         if state_changed:
             _LOGGER.debug("State change detected in compact status, requesting full status")
-            asyncio.create_task(self._request_full_status())
+            task = asyncio.create_task(self._request_full_status())
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
 
     async def _request_full_status(self) -> None:
         """Request a full status update from the kettle.
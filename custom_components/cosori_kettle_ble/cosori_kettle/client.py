@@ -16,6 +16,7 @@ from bleak.exc import BleakError
 from .exceptions import ProtocolError
 from .protocol import (
     ACK_HEADER_TYPE,
+    BLE_CHUNK_SIZE,
     CMD_CTRL,
     CMD_DELAYED_START,
     CMD_HELLO,
@@ -36,7 +37,6 @@ from .protocol import (
     MIN_TEMP_F,
     build_packet,
     parse_frames,
-    split_into_packets,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -48,7 +48,7 @@ CHAR_MODEL_NUMBER_UUID = "00002a24-0000-1000-8000-00805f9b34fb"
 CHAR_MANUFACTURER_UUID = "00002a29-0000-1000-8000-00805f9b34fb"
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceInfo:
     """Device information from BLE Device Information Service."""
 
@@ -86,6 +86,10 @@ class CosoriKettleBLEClient:
         """
         self._ble_device = ble_device
         self._registration_key = registration_key
+        # ASCII hex form of the key as sent in register/hello payloads
+        self._registration_key_ascii = (
+            registration_key.hex().encode("ascii") if registration_key is not None else b""
+        )
         self._protocol_version = protocol_version
         self._tx_seq = 0
         self._notification_callback = notification_callback
@@ -150,6 +154,16 @@ class CosoriKettleBLEClient:
         """Handle disconnection."""
         _LOGGER.warning("Disconnected from %s", self._ble_device.address)
         self._connected = False
+
+        # Fail pending ACK waiters now rather than letting them time out
+        for future in self._pending_ack.values():
+            if not future.done():
+                future.set_exception(BleakError("Disconnected while waiting for ACK"))
+        self._pending_ack.clear()
+
+        # A partial frame from this link must not prefix the next one
+        self._rx_buffer.clear()
+
         if self._disconnected_callback:
             self._disconnected_callback()
 
@@ -250,19 +264,32 @@ class CosoriKettleBLEClient:
 
     def _notification_handler(self, sender: int, data: bytearray) -> None:
         """Handle BLE notifications."""
-        _LOGGER.debug("Received notification: %s", data.hex())
-        self._rx_buffer.extend(data)
-
-        # Parse all available frames
-        frames, bytes_consumed = parse_frames(self._rx_buffer)
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug:
+            _LOGGER.debug("Received notification: %s", data.hex())
+
+        if self._rx_buffer:
+            # Continue a frame split across notifications
+            self._rx_buffer.extend(data)
+            frames, bytes_consumed = parse_frames(self._rx_buffer)
+
+            # Remove consumed bytes from buffer in place
+            if bytes_consumed > 0:
+                del self._rx_buffer[:bytes_consumed]
+        else:
+            # Fast path: parse the notification directly and only buffer leftovers
+            frames, bytes_consumed = parse_frames(data)
+            if bytes_consumed < len(data):
+                self._rx_buffer.extend(memoryview(data)[bytes_consumed:])
 
         for frame in frames:
-            _LOGGER.debug(
-                "Processed frame: type=%02x seq=%02x payload=%s",
-                frame.frame_type,
-                frame.seq,
-                frame.payload.hex(),
-            )
+            if debug:
+                _LOGGER.debug(
+                    "Processed frame: type=%02x seq=%02x payload=%s",
+                    frame.frame_type,
+                    frame.seq,
+                    frame.payload.hex(),
+                )
 
             # Handle ACK frames
             if frame.frame_type == ACK_HEADER_TYPE:
@@ -272,17 +299,14 @@ class CosoriKettleBLEClient:
             if self._notification_callback:
                 self._notification_callback(frame)
 
-        # Remove consumed bytes from buffer
-        if bytes_consumed > 0:
-            self._rx_buffer = self._rx_buffer[bytes_consumed:]
-
     def _handle_ack(self, seq: int, payload: bytes) -> None:
         """Handle ACK frame."""
-        _LOGGER.debug("ACK received: seq=%02x payload=%s", seq, payload.hex())
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("ACK received: seq=%02x payload=%s", seq, payload.hex())
 
         # Complete pending future if exists
-        if seq in self._pending_ack:
-            future = self._pending_ack.pop(seq)
+        future = self._pending_ack.pop(seq, None)
+        if future is not None:
             if not future.done():
                 future.set_result(payload)
                 _LOGGER.debug("ACK future completed for seq=%02x", seq)
@@ -301,6 +325,7 @@ class CosoriKettleBLEClient:
 
         Raises:
             asyncio.TimeoutError: If ACK timeout
+            BleakError: If the device disconnects before the ACK arrives
             ValueError: If ACK validation fails
         """
         try:
@@ -353,6 +378,7 @@ class CosoriKettleBLEClient:
         Raises:
             RuntimeError: If not connected
             asyncio.TimeoutError: If ACK timeout
+            BleakError: If the device disconnects before the ACK arrives
             ValueError: If ACK validation fails
         """
         if not self.is_connected:
@@ -362,29 +388,39 @@ class CosoriKettleBLEClient:
             # Build packet
             packet = build_packet(frame)
 
-            # Create future for ACK if needed
-            ack_future: asyncio.Future[bytes] | None = None
-            if wait_for_ack:
-                ack_future = asyncio.Future()
-                self._pending_ack[frame.seq] = ack_future
+            if not wait_for_ack:
+                await self._write_packet(packet)
+                return None
+
+            # Create future for ACK
+            ack_future: asyncio.Future[bytes] = asyncio.get_running_loop().create_future()
+            self._pending_ack[frame.seq] = ack_future
 
             try:
-                # Send packet in chunks
-                packets = split_into_packets(packet)
-                for pkt in packets:
-                    _LOGGER.debug("Sending packet: %s", pkt.hex())
-                    await self._client.write_gatt_char(CHAR_TX_UUID, pkt, response=True)
+                await self._write_packet(packet)
 
-                # Wait for and validate ACK if needed
-                if wait_for_ack and ack_future:
-                    return await self._wait_for_ack(frame, ack_future)
+                # Wait for and validate ACK
+                return await self._wait_for_ack(frame, ack_future)
 
             finally:
                 # Clean up pending ACK if not completed
-                if wait_for_ack and frame.seq in self._pending_ack:
-                    self._pending_ack.pop(frame.seq, None)
+                self._pending_ack.pop(frame.seq, None)
 
-        return None
+    async def _write_packet(self, packet: bytes) -> None:
+        """Write a packet to the TX characteristic in BLE-sized chunks.
+
+        Chunks are zero-copy views into the packet. Only the final chunk is
+        written with response so intermediate chunks don't each wait a
+        connection event.
+        """
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        view = memoryview(packet)
+        last = len(view) - BLE_CHUNK_SIZE
+        for offset in range(0, len(view), BLE_CHUNK_SIZE):
+            pkt = view[offset : offset + BLE_CHUNK_SIZE]
+            if debug:
+                _LOGGER.debug("Sending packet: %s", pkt.hex())
+            await self._client.write_gatt_char(CHAR_TX_UUID, pkt, response=offset >= last)
 
     async def send_register(self, wait_for_ack: bool = True) -> bytes | None:
         """Send register packet for initial pairing.
@@ -405,15 +441,8 @@ class CosoriKettleBLEClient:
             raise ValueError("Registration key must be exactly 16 bytes")
 
         # Build payload with hex ASCII encoded registration key
-        payload = bytearray(36)
-        payload[0] = self._protocol_version
-        payload[1] = CMD_REGISTER
-        payload[2] = CMD_TYPE_D1
-        payload[3] = 0x00
-        hex_key = self._registration_key.hex()
-        payload[4:] = hex_key.encode("ascii")
-
-        frame = Frame(frame_type=MESSAGE_HEADER_TYPE, seq=self._tx_seq, payload=bytes(payload))
+        payload = bytes([self._protocol_version, CMD_REGISTER, CMD_TYPE_D1, 0x00]) + self._registration_key_ascii
+        frame = Frame(frame_type=MESSAGE_HEADER_TYPE, seq=self._tx_seq, payload=payload)
         result = await self.send_frame(frame, wait_for_ack)
         self._tx_seq = (self._tx_seq + 1) & 0xFF
         return result
@@ -437,15 +466,8 @@ class CosoriKettleBLEClient:
             raise ValueError("Registration key must be exactly 16 bytes")
 
         # Build payload with hex ASCII encoded registration key
-        payload = bytearray(36)
-        payload[0] = self._protocol_version
-        payload[1] = CMD_HELLO
-        payload[2] = CMD_TYPE_D1
-        payload[3] = 0x00
-        hex_key = self._registration_key.hex()
-        payload[4:] = hex_key.encode("ascii")
-
-        frame = Frame(frame_type=MESSAGE_HEADER_TYPE, seq=self._tx_seq, payload=bytes(payload))
+        payload = bytes([self._protocol_version, CMD_HELLO, CMD_TYPE_D1, 0x00]) + self._registration_key_ascii
+        frame = Frame(frame_type=MESSAGE_HEADER_TYPE, seq=self._tx_seq, payload=payload)
         result = await self.send_frame(frame, wait_for_ack)
         self._tx_seq = (self._tx_seq + 1) & 0xFF
         return result
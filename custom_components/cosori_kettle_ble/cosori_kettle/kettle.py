@@ -1,7 +1,6 @@
 """High-level API for controlling Cosori Kettle."""
 from __future__ import annotations
 
-import asyncio
 import logging
 from typing import Callable
 
@@ -189,11 +188,11 @@ class CosoriKettle:
         Returns:
             Current status or None if update failed
         """
+        # The extended status is the ACK payload for the poll. The client
+        # resolves the ACK future and then calls _on_notification in the same
+        # callback, so the status is stored before this await resumes
         await self._client.send_status_request()
 
-        # Wait a bit for response
-        await asyncio.sleep(0.5)
-
         return self._current_status
 
     async def heat_to_temperature(self, temp_f: int, hold_time_seconds: int = 0) -> None:
@@ -7,6 +7,7 @@ parsing, checksum validation, and status decoding.
 from __future__ import annotations
 
 from dataclasses import dataclass
+import struct
 from typing import Optional
 
 # Protocol constants
@@ -15,6 +16,9 @@ MESSAGE_HEADER_TYPE = 0x22  # A522 = A5 + 22
 ACK_HEADER_TYPE = 0x12  # A512 = A5 + 12
 BLE_CHUNK_SIZE = 20
 
+# Envelope header: magic, type, seq, payload length (LE16), checksum
+_HEADER = struct.Struct("<BBBHB")
+
 # Protocol versions
 PROTOCOL_VERSION_V0 = 0x00
 PROTOCOL_VERSION_V1 = 0x01
@@ -75,7 +79,7 @@ MODE_NAMES = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class CompactStatus:
     """Compact status from kettle."""
 
@@ -86,7 +90,7 @@ class CompactStatus:
     valid: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtendedStatus:
     """Extended status from kettle."""
 
@@ -102,7 +106,7 @@ class ExtendedStatus:
     valid: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Frame:
     """BLE packet frame with header.
 
@@ -166,76 +170,70 @@ def parse_frames(buffer: bytearray, max_payload_size: int = 512) -> tuple[list[F
     """
     frames = []
     pos = 0
+    # Checksums and payloads are read through a view so a frame is copied
+    # only once, into its payload. The view is released on exit, even on
+    # error, so callers can resize the buffer afterwards
+    with memoryview(buffer) as view:
+        while pos < len(buffer):
+            # Find frame start
+            frame_start = _find_frame_start(buffer, pos)
+            if frame_start >= len(buffer):
+                break
 
-    while pos < len(buffer):
-        # Find frame start
-        frame_start = _find_frame_start(buffer, pos)
-        if frame_start >= len(buffer):
-            break
-
-        pos = frame_start
+            pos = frame_start
 
-        # Validate header
-        if pos + 6 > len(buffer):
-            break
+            # Validate header
+            if pos + 6 > len(buffer):
+                break
 
-        if buffer[pos] != FRAME_MAGIC:
-            pos += 1
-            continue
+            magic, frame_type, seq, payload_len, checksum = _HEADER.unpack_from(buffer, pos)
 
-        frame_type = buffer[pos + 1]
-        seq = buffer[pos + 2]
-        payload_len = buffer[pos + 3] | (buffer[pos + 4] << 8)
-        checksum = buffer[pos + 5]
+            if magic != FRAME_MAGIC:
+                pos += 1
+                continue
 
-        # Validate payload length
-        if payload_len > max_payload_size:
-            pos += 1
-            continue
+            # Validate payload length
+            if payload_len > max_payload_size:
+                pos += 1
+                continue
 
-        frame_len = 6 + payload_len
+            frame_len = 6 + payload_len
 
-        # Wait for complete frame
-        if pos + frame_len > len(buffer):
-            break
+            # Wait for complete frame
+            if pos + frame_len > len(buffer):
+                break
 
-        # Validate checksum
-        frame_data = buffer[pos : pos + frame_len]
-        calculated_checksum = _calculate_checksum(frame_data)
+            # Validate checksum
+            calculated_checksum = _calculate_checksum(view[pos : pos + frame_len])
 
-        if checksum != calculated_checksum:
-            pos += 1
-            continue
+            if checksum != calculated_checksum:
+                pos += 1
+                continue
 
-        # Extract payload and create frame
-        payload = bytes(frame_data[6:])
-        frames.append(Frame(frame_type=frame_type, seq=seq, payload=payload))
+            # Extract payload and create frame
+            payload = bytes(view[pos + 6 : pos + frame_len])
+            frames.append(Frame(frame_type=frame_type, seq=seq, payload=payload))
 
-        pos += frame_len
+            pos += frame_len
 
     return frames, pos
 
 
 def _find_frame_start(buffer: bytearray, start_pos: int) -> int:
     """Find next frame start (FRAME_MAGIC) in buffer."""
-    for i in range(start_pos, len(buffer)):
-        if buffer[i] == FRAME_MAGIC:
-            return i
-    return len(buffer)
+    index = buffer.find(FRAME_MAGIC, start_pos)
+    return index if index >= 0 else len(buffer)
 
 
-def _calculate_checksum(buffer: bytes | bytearray) -> int:
+def _calculate_checksum(buffer: bytes | bytearray | memoryview) -> int:
     """Calculate checksum for envelope."""
     # Detect protocol version
     is_v1 = len(buffer) > 6 and buffer[6] == 0x01
 
     if is_v1:
-        # V1: iterative subtraction
-        checksum = 0
-        for i, byte in enumerate(buffer):
-            byte_val = 0x01 if i == 5 else byte
-            checksum = (checksum - byte_val) & 0xFF
-        return checksum
+        # V1: subtract every byte from zero, counting the checksum byte as 0x01.
+        # Equivalent to negating the sum, which sum() computes in C.
+        return (buffer[5] - 0x01 - sum(buffer)) & 0xFF
     else:
         # V0: sum of header bytes
         if len(buffer) < 6:
@@ -380,17 +378,16 @@ def parse_registration_key_from_packets(packet1: str, packet2: str, packet3: str
     if len(p3) != 4:
         raise ValueError(f"Third packet must be 4 hex characters (2 bytes), got {len(p3)}")
 
-    # Validate hex format
+    # Validate hex format (decoded once and reused below)
     try:
-        bytes.fromhex(p1)
-        bytes.fromhex(p2)
-        bytes.fromhex(p3)
+        packet1_bytes = bytes.fromhex(p1)
+        packet2_bytes = bytes.fromhex(p2)
+        packet3_bytes = bytes.fromhex(p3)
     except ValueError as e:
         raise ValueError(f"Invalid hex format in packets: {e}")
 
     # Parse first packet as a frame to validate it's a hello command
     try:
-        packet1_bytes = bytes.fromhex(p1)
         # Check magic byte and validate it's a hello command
         if packet1_bytes[0] != FRAME_MAGIC:
             raise ValueError(f"First packet doesn't start with magic byte (0xA5), got {packet1_bytes[0]:02x}")
@@ -412,14 +409,12 @@ def parse_registration_key_from_packets(packet1: str, packet2: str, packet3: str
     # Third packet: 2 bytes
     # Total: 32 ASCII characters (64 hex chars) encoding 16-byte hex key
 
-    # Take last 10 bytes from p1 (20 hex chars), all of p2 (40 hex chars), and all of p3 (4 hex chars)
-    # Total: 64 hex chars = 32 bytes of ASCII data
-    key_ascii_hex = p1[20:] + p2 + p3  # 20 + 40 + 4 = 64 hex chars = 32 bytes
+    # Take last 10 bytes from p1, all 20 bytes of p2, and both bytes of p3
+    # Total: 32 bytes of ASCII data
+    ascii_bytes = packet1_bytes[10:] + packet2_bytes + packet3_bytes
 
-    # The 32 bytes (64 hex chars) represent ASCII-encoded hex string
-    # Convert to bytes to get ASCII characters
+    # The 32 bytes represent an ASCII-encoded hex string
     try:
-        ascii_bytes = bytes.fromhex(key_ascii_hex)
         # Decode ASCII to get the hex string of the actual key
         key_hex_string = ascii_bytes.decode('ascii')
         # Convert hex string to final 16-byte key
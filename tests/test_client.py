@@ -2,6 +2,7 @@
 import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch, call
 import pytest
+from bleak.exc import BleakError
 
 from custom_components.cosori_kettle_ble.cosori_kettle.client import (
     CosoriKettleBLEClient,
@@ -13,6 +14,8 @@ from custom_components.cosori_kettle_ble.cosori_kettle.protocol import (
     Frame,
     MESSAGE_HEADER_TYPE,
     build_packet,
+    parse_frames,
+    split_into_packets,
 )
 
 
@@ -171,6 +174,29 @@ class TestConnectionAndDisconnection:
             assert client._connected is False
             disconnected_callback.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_on_disconnect_fails_pending_ack(self, client, mock_bleak_client):
+        """Test that disconnection fails pending ACK futures immediately."""
+        ack_future = asyncio.get_running_loop().create_future()
+        client._pending_ack[0x30] = ack_future
+
+        client._on_disconnect(mock_bleak_client)
+
+        assert ack_future.done()
+        with pytest.raises(BleakError, match="Disconnected"):
+            ack_future.result()
+        assert client._pending_ack == {}
+
+    def test_on_disconnect_clears_rx_buffer(self, client, mock_bleak_client):
+        """Test that disconnection drops any partial frame in place."""
+        rx_buffer = client._rx_buffer
+        rx_buffer.extend(bytes([0xA5, 0x22, 0x01]))
+
+        client._on_disconnect(mock_bleak_client)
+
+        assert client._rx_buffer is rx_buffer
+        assert len(client._rx_buffer) == 0
+
     def test_is_connected_property(self, client, mock_bleak_client):
         """Test is_connected property."""
         # Not connected initially
@@ -295,6 +321,41 @@ class TestSendFrame:
             # Should have multiple write calls for a large frame
             assert mock_bleak_client.write_gatt_char.call_count >= 1
 
+    @pytest.mark.asyncio
+    async def test_send_frame_only_last_chunk_with_response(self, client, mock_bleak_client):
+        """Test that only the final chunk is written with response."""
+        with patch(
+            "custom_components.cosori_kettle_ble.cosori_kettle.client.BleakClient",
+            return_value=mock_bleak_client,
+        ):
+            await client.connect()
+
+            # 6 header + 36 payload = 42 bytes -> 3 chunks
+            frame = Frame(frame_type=0x22, seq=0x07, payload=b"\x01\x81" + b"\x00" * 34)
+            await client.send_frame(frame, wait_for_ack=False)
+
+            responses = [
+                c.kwargs["response"] for c in mock_bleak_client.write_gatt_char.call_args_list
+            ]
+            assert responses == [False, False, True]
+
+    @pytest.mark.asyncio
+    async def test_send_frame_chunks_match_split_packets(self, client, mock_bleak_client):
+        """Test that written chunks match split_into_packets output."""
+        with patch(
+            "custom_components.cosori_kettle_ble.cosori_kettle.client.BleakClient",
+            return_value=mock_bleak_client,
+        ):
+            await client.connect()
+
+            frame = Frame(frame_type=0x22, seq=0x08, payload=b"\x01\x81" + bytes(range(40)))
+            await client.send_frame(frame, wait_for_ack=False)
+
+            written = [
+                bytes(c.args[1]) for c in mock_bleak_client.write_gatt_char.call_args_list
+            ]
+            assert written == split_into_packets(build_packet(frame))
+
     @pytest.mark.asyncio
     async def test_send_frame_cleans_up_pending_ack_on_error(self, client, mock_bleak_client):
         """Test that pending ACK is cleaned up when sending fails."""
@@ -481,6 +542,59 @@ class TestNotificationHandling:
         # Buffer should be cleared after frame is parsed
         assert len(client._rx_buffer) == 0
 
+    def test_notification_handler_complete_frame_skips_buffer(
+        self, client, notification_callback
+    ):
+        """Test a complete frame is parsed from the notification itself."""
+        packet = build_packet(Frame(frame_type=0x22, seq=0x12, payload=b"\x01\x81\xD1\x00"))
+        data = bytearray(packet)
+
+        with patch(
+            "custom_components.cosori_kettle_ble.cosori_kettle.client.parse_frames",
+            wraps=parse_frames,
+        ) as mock_parse:
+            client._notification_handler(1, data)
+
+        assert mock_parse.call_args[0][0] is data
+        notification_callback.assert_called_once()
+        assert client._rx_buffer == bytearray()
+
+    def test_notification_handler_keeps_only_partial_tail(
+        self, client, notification_callback
+    ):
+        """Test only the unparsed tail of a notification is buffered."""
+        packet1 = build_packet(Frame(frame_type=0x22, seq=0x13, payload=b"\x01\x81\xD1\x00"))
+        packet2 = build_packet(Frame(frame_type=0x22, seq=0x14, payload=b"\x01\x40\xD1\x00"))
+        tail = packet2[:7]
+
+        client._notification_handler(1, bytearray(packet1 + tail))
+
+        notification_callback.assert_called_once()
+        assert notification_callback.call_args[0][0].seq == 0x13
+        assert client._rx_buffer == bytearray(tail)
+
+    def test_notification_handler_split_frame_uses_buffer(
+        self, client, notification_callback
+    ):
+        """Test a frame split across notifications is completed in the RX buffer."""
+        packet = build_packet(Frame(frame_type=0x22, seq=0x15, payload=b"\x01\x81\xD1\x00"))
+
+        with patch(
+            "custom_components.cosori_kettle_ble.cosori_kettle.client.parse_frames",
+            wraps=parse_frames,
+        ) as mock_parse:
+            client._notification_handler(1, bytearray(packet[:5]))
+            notification_callback.assert_not_called()
+            assert client._rx_buffer == bytearray(packet[:5])
+
+            client._notification_handler(1, bytearray(packet[5:]))
+
+        # The second notification is parsed from the buffer, not on its own
+        assert mock_parse.call_args[0][0] is client._rx_buffer
+        notification_callback.assert_called_once()
+        assert notification_callback.call_args[0][0].seq == 0x15
+        assert client._rx_buffer == bytearray()
+
     def test_notification_handler_with_ack_frame(self, client, notification_callback):
         """Test handling ACK frame in notification."""
         ack_frame = Frame(frame_type=ACK_HEADER_TYPE, seq=0x12, payload=b"\x01\x81\x00\x00\x00")
@@ -741,3 +855,27 @@ class TestEdgeCases:
 
         notification_callback.assert_not_called()
         assert len(client._rx_buffer) == 0
+
+    @pytest.mark.asyncio
+    async def test_send_hello_payload(self, mock_ble_device):
+        """Test hello payload carries the ASCII hex registration key."""
+        key = bytes.fromhex("0123456789abcdef0123456789abcdef")
+        client = CosoriKettleBLEClient(mock_ble_device, registration_key=key)
+        client.send_frame = AsyncMock(return_value=None)
+
+        await client.send_hello(wait_for_ack=False)
+
+        frame = client.send_frame.call_args[0][0]
+        assert frame.payload == b"\x01\x81\xD1\x00" + key.hex().encode("ascii")
+        assert len(frame.payload) == 36
+
+    def test_rx_buffer_trimmed_in_place(self, client):
+        """Test that consumed bytes are removed without replacing the buffer."""
+        frame = Frame(frame_type=0x22, seq=0x25, payload=b"\x01\x81\xD1\x00")
+        packet = build_packet(frame)
+        buffer = client._rx_buffer
+
+        client._notification_handler(1, bytearray(packet + packet[:3]))
+
+        assert client._rx_buffer is buffer
+        assert client._rx_buffer == bytearray(packet[:3])
@@ -31,6 +31,7 @@ from custom_components.cosori_kettle_ble.climate import (
     PRESET_TO_KETTLE_MODE,
     KETTLE_MODE_TO_PRESET,
     MODE_TEMPS,
+    TEMP_F_TO_MODE,
 )
 
 
@@ -59,6 +60,7 @@ def mock_coordinator():
     }
     coordinator.async_set_mode = AsyncMock()
     coordinator.async_request_refresh = AsyncMock()
+    coordinator.async_set_updated_data = MagicMock()
     coordinator.async_stop_heating = AsyncMock()
     return coordinator
 
@@ -236,7 +238,40 @@ class TestCosoriKettleClimateSetTemperature:
         await climate_entity.async_set_temperature(temperature=175)
 
         mock_coordinator.async_set_mode.assert_called_once_with(MODE_MY_TEMP, 175, 0)
-        mock_coordinator.async_request_refresh.assert_called_once()
+        mock_coordinator.async_set_updated_data.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_set_temperature_updates_data_optimistically(self, climate_entity, mock_coordinator):
+        """Test the expected state is applied locally instead of polling."""
+        await climate_entity.async_set_temperature(temperature=175)
+
+        mock_coordinator.async_request_refresh.assert_not_called()
+        mock_coordinator.async_set_updated_data.assert_called_once_with({
+            "temperature": 75.0,
+            "setpoint": 175,
+            "heating": True,
+            "stage": 0,
+            "mode": MODE_MY_TEMP,
+            "my_temp": 180,
+            "configured_hold_time": 0,
+            "remaining_hold_time": 0,
+        })
+
+    @pytest.mark.asyncio
+    async def test_set_temperature_clears_hold_and_keeps_stage(
+        self, climate_entity, mock_coordinator
+    ):
+        """Test the optimistic update applies the hold sent and leaves the stage."""
+        mock_coordinator.data.update(
+            {"stage": 3, "configured_hold_time": 600, "remaining_hold_time": 420}
+        )
+        await climate_entity.async_set_temperature(temperature=175)
+
+        data = mock_coordinator.async_set_updated_data.call_args[0][0]
+        assert data["configured_hold_time"] == 0
+        assert data["remaining_hold_time"] == 0
+        assert data["stage"] == 3
+        assert data["heating"] is True
 
     @pytest.mark.asyncio
     async def test_set_temperature_near_boil_uses_boil_mode(self, climate_entity, mock_coordinator):
@@ -266,6 +301,16 @@ class TestCosoriKettleClimateSetTemperature:
 
         mock_coordinator.async_set_mode.assert_called_once_with(MODE_COFFEE, 205, 0)
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("offset", [-3, 3])
+    async def test_set_temperature_three_degrees_from_preset_uses_my_temp(
+        self, climate_entity, mock_coordinator, offset
+    ):
+        """Test temperatures 3F from a preset keep MY_TEMP mode and the raw value."""
+        await climate_entity.async_set_temperature(temperature=195 + offset)
+
+        mock_coordinator.async_set_mode.assert_called_once_with(MODE_MY_TEMP, 195 + offset, 0)
+
     @pytest.mark.asyncio
     async def test_set_temperature_exact_preset_value(self, climate_entity, mock_coordinator):
         """Test setting exact preset temperature uses that mode."""
@@ -293,7 +338,7 @@ class TestCosoriKettleClimateSetTemperature:
         await climate_entity.async_set_temperature()
 
         mock_coordinator.async_set_mode.assert_not_called()
-        mock_coordinator.async_request_refresh.assert_not_called()
+        mock_coordinator.async_set_updated_data.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_set_temperature_min_value(self, climate_entity, mock_coordinator):
@@ -319,7 +364,10 @@ class TestCosoriKettleClimateSetHVACMode:
         await climate_entity.async_set_hvac_mode(HVACMode.OFF)
 
         mock_coordinator.async_stop_heating.assert_called_once()
-        mock_coordinator.async_request_refresh.assert_called_once()
+        mock_coordinator.async_request_refresh.assert_not_called()
+        data = mock_coordinator.async_set_updated_data.call_args[0][0]
+        assert data["heating"] is False
+        assert data["stage"] == 0
 
     @pytest.mark.asyncio
     async def test_set_hvac_mode_heat(self, climate_entity, mock_coordinator):
@@ -329,8 +377,8 @@ class TestCosoriKettleClimateSetHVACMode:
 
         # Should use current preset (BOIL)
         mock_coordinator.async_set_mode.assert_called_once_with(MODE_BOIL, 212, 0)
-        # Called twice: once in async_set_hvac_mode and once in async_set_preset_mode
-        assert mock_coordinator.async_request_refresh.call_count == 2
+        mock_coordinator.async_request_refresh.assert_not_called()
+        mock_coordinator.async_set_updated_data.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_set_hvac_mode_heat_uses_my_temp_default(self, climate_entity, mock_coordinator):
@@ -339,8 +387,8 @@ class TestCosoriKettleClimateSetHVACMode:
         await climate_entity.async_set_hvac_mode(HVACMode.HEAT)
 
         mock_coordinator.async_set_mode.assert_called_once_with(MODE_MY_TEMP, 212, 0)
-        # Called twice: once in async_set_hvac_mode and once in async_set_preset_mode
-        assert mock_coordinator.async_request_refresh.call_count == 2
+        mock_coordinator.async_request_refresh.assert_not_called()
+        mock_coordinator.async_set_updated_data.assert_called_once()
 
 
 class TestCosoriKettleClimateSetPresetMode:
@@ -352,7 +400,23 @@ class TestCosoriKettleClimateSetPresetMode:
         await climate_entity.async_set_preset_mode(PRESET_BOIL)
 
         mock_coordinator.async_set_mode.assert_called_once_with(MODE_BOIL, 212, 0)
-        mock_coordinator.async_request_refresh.assert_called_once()
+        mock_coordinator.async_set_updated_data.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_set_preset_mode_clears_hold_and_keeps_stage(
+        self, climate_entity, mock_coordinator
+    ):
+        """Test the optimistic update applies the hold sent and leaves the stage."""
+        mock_coordinator.data.update(
+            {"stage": 3, "configured_hold_time": 600, "remaining_hold_time": 420}
+        )
+        await climate_entity.async_set_preset_mode(PRESET_BOIL)
+
+        data = mock_coordinator.async_set_updated_data.call_args[0][0]
+        assert data["configured_hold_time"] == 0
+        assert data["remaining_hold_time"] == 0
+        assert data["stage"] == 3
+        assert data["heating"] is True
 
     @pytest.mark.asyncio
     async def test_set_preset_mode_green_tea(self, climate_entity, mock_coordinator):
@@ -360,7 +424,7 @@ class TestCosoriKettleClimateSetPresetMode:
         await climate_entity.async_set_preset_mode(PRESET_GREEN_TEA)
 
         mock_coordinator.async_set_mode.assert_called_once_with(MODE_GREEN_TEA, 180, 0)
-        mock_coordinator.async_request_refresh.assert_called_once()
+        mock_coordinator.async_set_updated_data.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_set_preset_mode_oolong(self, climate_entity, mock_coordinator):
@@ -368,7 +432,7 @@ class TestCosoriKettleClimateSetPresetMode:
         await climate_entity.async_set_preset_mode(PRESET_OOLONG)
 
         mock_coordinator.async_set_mode.assert_called_once_with(MODE_OOLONG, 195, 0)
-        mock_coordinator.async_request_refresh.assert_called_once()
+        mock_coordinator.async_set_updated_data.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_set_preset_mode_coffee(self, climate_entity, mock_coordinator):
@@ -376,7 +440,7 @@ class TestCosoriKettleClimateSetPresetMode:
         await climate_entity.async_set_preset_mode(PRESET_COFFEE)
 
         mock_coordinator.async_set_mode.assert_called_once_with(MODE_COFFEE, 205, 0)
-        mock_coordinator.async_request_refresh.assert_called_once()
+        mock_coordinator.async_set_updated_data.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_set_preset_mode_my_temp(self, climate_entity, mock_coordinator):
@@ -385,7 +449,7 @@ class TestCosoriKettleClimateSetPresetMode:
         await climate_entity.async_set_preset_mode(PRESET_MY_TEMP)
 
         mock_coordinator.async_set_mode.assert_called_once_with(MODE_MY_TEMP, 180, 0)
-        mock_coordinator.async_request_refresh.assert_called_once()
+        mock_coordinator.async_set_updated_data.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_set_preset_mode_my_temp_uses_default_when_no_data(
@@ -413,7 +477,7 @@ class TestCosoriKettleClimateSetPresetMode:
         await climate_entity.async_set_preset_mode("invalid_preset")
 
         mock_coordinator.async_set_mode.assert_not_called()
-        mock_coordinator.async_request_refresh.assert_not_called()
+        mock_coordinator.async_set_updated_data.assert_not_called()
 
 
 class TestCosoriKettleClimateTurnOnOff:
@@ -434,7 +498,10 @@ class TestCosoriKettleClimateTurnOnOff:
         await climate_entity.async_turn_off()
 
         mock_coordinator.async_stop_heating.assert_called_once()
-        mock_coordinator.async_request_refresh.assert_called_once()
+        mock_coordinator.async_request_refresh.assert_not_called()
+        data = mock_coordinator.async_set_updated_data.call_args[0][0]
+        assert data["heating"] is False
+        assert data["stage"] == 0
 
 
 class TestCosoriKettleClimateCoordinatorDataUpdates:
@@ -519,6 +586,27 @@ class TestCosoriKettleClimateModeMappings:
         for preset, kettle_mode in PRESET_TO_KETTLE_MODE.items():
             assert KETTLE_MODE_TO_PRESET[kettle_mode] == preset
 
+    def test_temp_f_to_mode_snaps_within_two_degrees(self):
+        """Test temperatures within 2F of a preset snap to its mode and temperature."""
+        for kettle_mode, preset_temp in MODE_TEMPS.items():
+            for offset in range(-2, 3):
+                assert TEMP_F_TO_MODE[preset_temp + offset] == (kettle_mode, preset_temp)
+
+    def test_temp_f_to_mode_excludes_three_degrees_away(self):
+        """Test temperatures 3F from a preset are not snapped."""
+        for preset_temp in MODE_TEMPS.values():
+            assert preset_temp - 3 not in TEMP_F_TO_MODE
+            assert preset_temp + 3 not in TEMP_F_TO_MODE
+
+    def test_temp_f_to_mode_preset_windows_do_not_overlap(self):
+        """Test no temperature falls within the window of two presets."""
+        windows = [
+            set(range(preset_temp - 2, preset_temp + 3))
+            for preset_temp in MODE_TEMPS.values()
+        ]
+        assert len(set().union(*windows)) == sum(len(window) for window in windows)
+        assert len(TEMP_F_TO_MODE) == 5 * len(MODE_TEMPS)
+
 
 class TestCosoriKettleClimateConstants:
     """Test climate entity constants are correct."""
@@ -582,7 +670,7 @@ class TestCosoriKettleClimateEdgeCases:
         await climate_entity.async_set_temperature(temperature=212)
 
         assert mock_coordinator.async_set_mode.call_count == 3
-        assert mock_coordinator.async_request_refresh.call_count == 3
+        assert mock_coordinator.async_set_updated_data.call_count == 3
 
     @pytest.mark.asyncio
     async def test_set_hvac_mode_multiple_times(self, climate_entity, mock_coordinator):
@@ -595,9 +683,9 @@ class TestCosoriKettleClimateEdgeCases:
 
         assert mock_coordinator.async_set_mode.call_count == 2
         assert mock_coordinator.async_stop_heating.call_count == 1
-        # Called 5 times: 2x for first HEAT (set_hvac_mode + set_preset_mode),
-        # 1x for OFF, 2x for second HEAT
-        assert mock_coordinator.async_request_refresh.call_count == 5
+        # Once per command: HEAT, OFF, HEAT
+        assert mock_coordinator.async_set_updated_data.call_count == 3
+        mock_coordinator.async_request_refresh.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_set_preset_mode_sequence(self, climate_entity, mock_coordinator):
@@ -608,7 +696,7 @@ class TestCosoriKettleClimateEdgeCases:
         await climate_entity.async_set_preset_mode(PRESET_COFFEE)
 
         assert mock_coordinator.async_set_mode.call_count == 4
-        assert mock_coordinator.async_request_refresh.call_count == 4
+        assert mock_coordinator.async_set_updated_data.call_count == 4
 
         # Verify correct modes were set
         calls = mock_coordinator.async_set_mode.call_args_list
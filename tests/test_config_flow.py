@@ -1,11 +1,13 @@
 """Tests for the config_flow module."""
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from homeassistant import data_entry_flow
 from homeassistant.const import CONF_ADDRESS
 from homeassistant.data_entry_flow import FlowResultType
 
-from custom_components.cosori_kettle_ble.const import SERVICE_UUID
+from custom_components.cosori_kettle_ble.const import CONF_REGISTRATION_KEY, SERVICE_UUID
 from custom_components.cosori_kettle_ble.config_flow import CosoriKettleConfigFlow
 
 
@@ -207,3 +209,162 @@ class TestAsyncStepUser:
             assert result["type"] == FlowResultType.FORM
             # The form should show "Cosori Kettle" as fallback name
             assert len(mock_config_flow._discovered_devices) == 1
+
+
+class TestAsyncStepPairDevice:
+    """Test the async_step_pair_device method."""
+
+    @pytest.mark.asyncio
+    async def test_pairing_timeout_during_connect(self, mock_config_flow):
+        """Test a kettle that never finishes connecting shows pairing_timeout."""
+        mock_config_flow._selected_address = "AA:BB:CC:DD:EE:FF"
+
+        async def hang(*args):
+            await asyncio.Event().wait()
+
+        mock_kettle = MagicMock()
+        mock_kettle.__aenter__ = AsyncMock(side_effect=hang)
+        mock_kettle.__aexit__ = AsyncMock(return_value=False)
+        mock_kettle.pair = AsyncMock()
+
+        with patch(
+            "custom_components.cosori_kettle_ble.config_flow.bluetooth.async_ble_device_from_address",
+            return_value=MagicMock(),
+        ), patch(
+            "custom_components.cosori_kettle_ble.config_flow.CosoriKettle",
+            return_value=mock_kettle,
+        ), patch(
+            "custom_components.cosori_kettle_ble.config_flow.PAIRING_TIMEOUT", 0.01
+        ):
+            result = await mock_config_flow.async_step_pair_device(user_input={})
+
+        assert result["type"] == FlowResultType.FORM
+        assert result["step_id"] == "pair_device"
+        assert result["errors"] == {"base": "pairing_timeout"}
+        mock_kettle.pair.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_pairing_timeout_during_pair(self, mock_config_flow):
+        """Test a kettle that never answers register + hello shows pairing_timeout."""
+        mock_config_flow._selected_address = "AA:BB:CC:DD:EE:FF"
+
+        async def hang():
+            await asyncio.Event().wait()
+
+        mock_kettle = MagicMock()
+        mock_kettle.__aenter__ = AsyncMock(return_value=mock_kettle)
+        mock_kettle.__aexit__ = AsyncMock(return_value=False)
+        mock_kettle.pair = AsyncMock(side_effect=hang)
+
+        with patch(
+            "custom_components.cosori_kettle_ble.config_flow.bluetooth.async_ble_device_from_address",
+            return_value=MagicMock(),
+        ), patch(
+            "custom_components.cosori_kettle_ble.config_flow.CosoriKettle",
+            return_value=mock_kettle,
+        ), patch(
+            "custom_components.cosori_kettle_ble.config_flow.PAIRING_TIMEOUT", 0.01
+        ):
+            result = await mock_config_flow.async_step_pair_device(user_input={})
+
+        assert result["type"] == FlowResultType.FORM
+        assert result["errors"] == {"base": "pairing_timeout"}
+        mock_kettle.__aexit__.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_ack_timeout_during_pair_is_pairing_failed(self, mock_config_flow):
+        """Test an ACK timeout inside pair() is not reported as pairing_timeout."""
+        mock_config_flow._selected_address = "AA:BB:CC:DD:EE:FF"
+
+        mock_kettle = MagicMock()
+        mock_kettle.__aenter__ = AsyncMock(return_value=mock_kettle)
+        mock_kettle.__aexit__ = AsyncMock(return_value=False)
+        mock_kettle.pair = AsyncMock(side_effect=asyncio.TimeoutError)
+
+        with patch(
+            "custom_components.cosori_kettle_ble.config_flow.bluetooth.async_ble_device_from_address",
+            return_value=MagicMock(),
+        ), patch(
+            "custom_components.cosori_kettle_ble.config_flow.CosoriKettle",
+            return_value=mock_kettle,
+        ):
+            result = await mock_config_flow.async_step_pair_device(user_input={})
+
+        assert result["type"] == FlowResultType.FORM
+        assert result["errors"] == {"base": "pairing_failed"}
+
+
+class TestAsyncStepEnterKey:
+    """Test the async_step_enter_key method."""
+
+    @pytest.fixture
+    def mock_kettle(self):
+        """Create a CosoriKettle mock whose connection succeeds."""
+        kettle = MagicMock()
+        kettle.__aenter__ = AsyncMock(return_value=kettle)
+        kettle.__aexit__ = AsyncMock(return_value=False)
+        return kettle
+
+    async def _enter_key(self, flow, mock_kettle, registration_key):
+        """Submit a registration key with the BLE side mocked out."""
+        flow._selected_address = "AA:BB:CC:DD:EE:FF"
+
+        with patch(
+            "custom_components.cosori_kettle_ble.config_flow.bluetooth.async_ble_device_from_address",
+            return_value=MagicMock(),
+        ), patch(
+            "custom_components.cosori_kettle_ble.config_flow.CosoriKettle",
+            return_value=mock_kettle,
+        ), patch.object(
+            flow, "async_create_entry", return_value={"type": FlowResultType.CREATE_ENTRY}
+        ) as mock_create_entry:
+            result = await flow.async_step_enter_key(
+                user_input={"registration_key": registration_key}
+            )
+
+        return result, mock_create_entry
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("registration_key", ["a" * 31, "a" * 33, "a" * 34])
+    async def test_wrong_length(self, mock_config_flow, mock_kettle, registration_key):
+        """Test keys that are not 32 hex characters report invalid_key_length."""
+        result, mock_create_entry = await self._enter_key(
+            mock_config_flow, mock_kettle, registration_key
+        )
+
+        assert result["type"] == FlowResultType.FORM
+        assert result["errors"] == {"registration_key": "invalid_key_length"}
+        mock_create_entry.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_non_hex(self, mock_config_flow, mock_kettle):
+        """Test a 32 character key with non-hex digits reports invalid_key_format."""
+        result, mock_create_entry = await self._enter_key(
+            mock_config_flow, mock_kettle, "0123456789abcdef0123456789abcdeg"
+        )
+
+        assert result["type"] == FlowResultType.FORM
+        assert result["errors"] == {"registration_key": "invalid_key_format"}
+        mock_create_entry.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_valid_key_is_stored_normalized(self, mock_config_flow, mock_kettle):
+        """Test spaces and uppercase digits in an accepted key are not stored."""
+        result, mock_create_entry = await self._enter_key(
+            mock_config_flow, mock_kettle, " 0123456789ABCDEF 0123456789ABCDEF "
+        )
+
+        assert result["type"] == FlowResultType.CREATE_ENTRY
+        data = mock_create_entry.call_args.kwargs["data"]
+        assert data[CONF_REGISTRATION_KEY] == "0123456789abcdef0123456789abcdef"
+
+    @pytest.mark.asyncio
+    async def test_embedded_whitespace_is_stored_normalized(self, mock_config_flow, mock_kettle):
+        """Test a 33 character key with an embedded tab stores the 32 hex digits."""
+        result, mock_create_entry = await self._enter_key(
+            mock_config_flow, mock_kettle, "0123456789abcdef\t0123456789abcdef"
+        )
+
+        assert result["type"] == FlowResultType.CREATE_ENTRY
+        data = mock_create_entry.call_args.kwargs["data"]
+        assert data[CONF_REGISTRATION_KEY] == "0123456789abcdef0123456789abcdef"
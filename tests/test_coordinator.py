@@ -192,6 +192,37 @@ class TestCoordinatorConnection:
             mock_cosori_client.read_device_info.assert_called_once()
             mock_cosori_client.connect.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_connect_reads_device_info_over_connection(self, coordinator, mock_ble_device, mock_cosori_client):
+        """Test that device info is read after connecting, reusing the connection."""
+        from custom_components.cosori_kettle_ble.cosori_kettle.client import DeviceInfo
+
+        calls = []
+        mock_cosori_client.connect.side_effect = lambda: calls.append("connect")
+
+        async def read_device_info():
+            calls.append("read_device_info")
+            return DeviceInfo(
+                hardware_version="1.0.00",
+                software_version="R0007V0012",
+                model_number="Test Model",
+                manufacturer="Cosori",
+                protocol_version=1,
+            )
+
+        mock_cosori_client.read_device_info.side_effect = read_device_info
+
+        with patch("custom_components.cosori_kettle_ble.coordinator.bluetooth") as mock_bt, \
+             patch("custom_components.cosori_kettle_ble.coordinator.CosoriKettleBLEClient") as mock_client_class, \
+             patch.object(coordinator, "_send_hello", new_callable=AsyncMock):
+
+            mock_bt.async_ble_device_from_address.return_value = mock_ble_device
+            mock_client_class.return_value = mock_cosori_client
+
+            await coordinator._connect()
+
+        assert calls == ["connect", "read_device_info"]
+
     @pytest.mark.asyncio
     async def test_connect_does_nothing_if_already_connected(self, coordinator, mock_cosori_client):
         """Test that connect does nothing if already connected."""
@@ -265,6 +296,26 @@ class TestCoordinatorConnection:
         # Should not raise
         await coordinator._disconnect()
 
+    @pytest.mark.asyncio
+    async def test_disconnect_cancels_background_tasks(self, coordinator, mock_cosori_client):
+        """Test disconnect cancels pending full status requests."""
+        coordinator._client = mock_cosori_client
+        blocker = asyncio.Event()
+
+        async def pending():
+            await blocker.wait()
+
+        task = asyncio.create_task(pending())
+        coordinator._background_tasks.add(task)
+        task.add_done_callback(coordinator._background_tasks.discard)
+        await asyncio.sleep(0)
+
+        await coordinator._disconnect()
+
+        assert task.cancelled()
+        assert not coordinator._background_tasks
+        assert coordinator._client is None
+
 
 class TestCoordinatorAsyncUpdateData:
     """Test _async_update_data method."""
@@ -6,6 +6,7 @@ import pytest
 
 from custom_components.cosori_kettle_ble.cosori_kettle.kettle import CosoriKettle
 from custom_components.cosori_kettle_ble.cosori_kettle.protocol import (
+    ACK_HEADER_TYPE,
     PROTOCOL_VERSION_V1,
     ExtendedStatus,
     Frame,
@@ -14,6 +15,8 @@ from custom_components.cosori_kettle_ble.cosori_kettle.protocol import (
     MODE_GREEN_TEA,
     MODE_MY_TEMP,
     MODE_OOLONG,
+    build_packet,
+    split_into_packets,
 )
 
 
@@ -353,6 +356,47 @@ class TestCosoriKettleUpdateStatus:
             # Verify send_frame was called
             # Client methods are called internally
 
+    @pytest.mark.asyncio
+    async def test_update_status_returns_status_from_ack(self, mock_ble_device, registration_key):
+        """Test that update_status returns the status carried by a real poll ACK without sleeping."""
+        kettle = CosoriKettle(mock_ble_device, registration_key)
+        client = kettle._client
+
+        bleak_client = MagicMock()
+        bleak_client.is_connected = True
+        client._client = bleak_client
+        client._connected = True
+
+        status_payload = bytes([
+            0x01, 0x40, 0x40, 0x00,  # poll ACK header, echoes the request
+            0x01, MODE_MY_TEMP, 180, 150, 180,  # stage, mode, setpoint, temp, my_temp
+            0x00,
+            0x3C, 0x00,  # configured hold (60)
+            0x1E, 0x00,  # remaining hold (30)
+            0x00,  # on base
+        ] + [0x00] * 14)
+        ack_packet = build_packet(Frame(frame_type=ACK_HEADER_TYPE, seq=0, payload=status_payload))
+        loop = asyncio.get_running_loop()
+
+        async def write_gatt_char(char_uuid, data, response):
+            # Answer the poll the way the kettle does, in BLE-sized notifications
+            if response:
+                for chunk in split_into_packets(ack_packet):
+                    loop.call_soon(client._notification_handler, 0, bytearray(chunk))
+
+        bleak_client.write_gatt_char = AsyncMock(side_effect=write_gatt_char)
+
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            status = await kettle.update_status()
+
+        assert status is not None
+        assert status is kettle.status
+        assert status.stage == 1
+        assert status.setpoint == 180
+        assert status.temp == 150
+        assert status.remaining_hold_time == 30
+        mock_sleep.assert_not_called()
+
 
 class TestCosoriKettleHeatingMethods:
     """Test all heating control methods."""
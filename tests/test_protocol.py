@@ -30,6 +30,18 @@ def test_build_packet():
     assert len(packet) == 10  # 6 header + 4 payload
 
 
+def test_build_packet_checksum_matches_calculate_checksum():
+    """Test build_packet checksum agrees with _calculate_checksum for V0, V1 and empty payloads."""
+    from custom_components.cosori_kettle_ble.cosori_kettle.protocol import _calculate_checksum
+
+    for payload in (b"", bytes([0x00, 0x40, 0x40, 0x00]), bytes([0x01, 0x40, 0x40, 0x00]), bytes(range(1, 40))):
+        packet = build_packet(Frame(frame_type=0x22, seq=0xFE, payload=payload))
+
+        assert isinstance(packet, bytes)
+        assert packet[6:] == payload
+        assert packet[5] == _calculate_checksum(packet)
+
+
 def test_parse_frames():
     """Test parsing frames from buffer."""
     # Build a test frame manually
@@ -346,6 +358,21 @@ def test_calculate_checksum_v1():
     assert checksum == 0x96
 
 
+def test_calculate_checksum_v1_ignores_checksum_byte():
+    """Test v1 checksum is independent of the value in the checksum slot."""
+    from custom_components.cosori_kettle_ble.cosori_kettle.protocol import _calculate_checksum
+
+    header = [0xA5, 0x22, 0x1c, 0x04, 0x00]
+    payload = [0x01, 0x81, 0xD1, 0x00]
+
+    for checksum_byte in (0x00, 0x01, 0x7F, 0xFF):
+        buffer = bytes(header + [checksum_byte] + payload)
+        expected = 0
+        for i, byte in enumerate(buffer):
+            expected = (expected - (0x01 if i == 5 else byte)) & 0xFF
+        assert _calculate_checksum(buffer) == expected
+
+
 def test_calculate_checksum_empty():
     """Test checksum calculation for empty buffer."""
     from custom_components.cosori_kettle_ble.cosori_kettle.protocol import _calculate_checksum
@@ -510,6 +537,23 @@ def test_parse_frames_buffer_without_magic():
     assert consumed == 0
 
 
+def test_parse_frames_leaves_buffer_resizable():
+    """Test parse_frames returns bytes payloads and releases its view of the buffer."""
+    frame = Frame(frame_type=0x22, seq=0x41, payload=bytes([0x01, 0x40, 0x40, 0x00]))
+    packet = build_packet(frame)
+
+    buffer = bytearray(packet + packet[:3])
+    frames, consumed = parse_frames(buffer)
+
+    assert type(frames[0].payload) is bytes
+    assert frames[0].payload == frame.payload
+
+    # Callers trim and extend the buffer in place after parsing
+    del buffer[:consumed]
+    buffer.extend(packet[3:])
+    assert buffer == bytearray(packet)
+
+
 def test_parse_extended_status_various_stages():
     """Test parsing extended status with different stage values."""
     payload = bytearray([